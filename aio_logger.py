@@ -1,4 +1,6 @@
-from Adafruit_IO import Client, Group, Feed
+from concurrent.futures import ThreadPoolExecutor
+
+from Adafruit_IO import Client, Group, Feed, RequestError
 
 # Change this feed group name if necessary
 GROUP_NAME = 'iaq_stats' # The feed group to use
@@ -8,6 +10,21 @@ FEED_HUMIDITY = 'humidity'  # The name of the humidity feed
 FEED_PRESSURE = 'pressure'  # The name of the pressure feed
 FEED_IAQ = 'iaq'  # The name of the IAQ feed
 
+FEEDS = [FEED_TEMPERATURE, FEED_HUMIDITY, FEED_PRESSURE, FEED_IAQ]
+
+def _is_not_found(err: RequestError) -> bool:
+    """
+    Check whether a RequestError is a 404 (Not Found) response.
+
+    RequestError doesn't keep the response, only a message of the form
+    "Adafruit IO request failed: <status> <reason> - <error>".
+
+    Parameters
+    ----------
+    err: The error raised by the Adafruit_IO Client.
+    """
+    return str(err).startswith("Adafruit IO request failed: 404 ")
+
 class AIO_Logger:
     """
     Adafruit.IO API Client wrapper.
@@ -21,25 +38,24 @@ class AIO_Logger:
         """
         self.aio = Client(aio_user, aio_key)
         self.create_group_if_needed()
-        self.temperature_feed = self.get_feed(FEED_TEMPERATURE)
-        self.humidity_feed = self.get_feed(FEED_HUMIDITY)
-        self.pressure_feed = self.get_feed(FEED_PRESSURE)
-        self.iaq_feed = self.get_feed(FEED_IAQ)
+        # make sure each feed exists in our feed group; the lookups are
+        # independent of each other, so make them concurrently
+        with ThreadPoolExecutor(max_workers=len(FEEDS)) as executor:
+            list(executor.map(self.get_feed, FEEDS))
 
     def create_group_if_needed(self):
         """
         Create a Feed Group on Adafruit.IO if it doesn't already exist.
         """
-        self.group = None
-        group_list: list[Group] = self.aio.groups()
-        for group in group_list:
-            if group.name == GROUP_NAME:
-                self.group = group
-                break
-        if self.group is None:
-            self.group = self.aio.create_group(GROUP_NAME)
+        try:
+            self.group: Group = self.aio.groups(GROUP_NAME)
+        except RequestError as err:
+            if not _is_not_found(err):
+                raise
+            # didn't find the group, so create it
+            self.group = self.aio.create_group(Group(name=GROUP_NAME))
 
-    def get_feed(self, feed_name: str):
+    def get_feed(self, feed_name: str) -> Feed:
         """
         Get a Feed object based on the feed_name parameter.
 
@@ -50,17 +66,20 @@ class AIO_Logger:
         feed_name: The name of the feed to retrieve/create.
         """
         feed_key = "%s.%s" % (self.group.key, feed_name)
-        feed_list: list[Feed] = self.aio.feeds()
-        for feed in feed_list:
-            if feed.key == feed_key:
-                return feed
-        # didn't find the feed, so create it
-        return self.aio.create_feed(feed_name, self.group.key)
+        try:
+            return self.aio.feeds(feed_key)
+        except RequestError as err:
+            if not _is_not_found(err):
+                raise
+            # didn't find the feed, so create it
+            return self.aio.create_feed(Feed(name=feed_name), self.group.key)
 
     def log(self, temperature, humidity, pressure, iaq):
         """
         Log IAQ data to Adafruit.IO
 
+        All four values are sent to the feed group in a single request.
+
         Parameters
         ----------
         temperature: Current ambient temperature.
@@ -68,7 +87,12 @@ class AIO_Logger:
         pressure: Current atmospheric pressure.
         iaq: Current calculated IAQ.
         """
-        self.aio.send(self.temperature_feed.key, temperature)
-        self.aio.send(self.humidity_feed.key, humidity)
-        self.aio.send(self.pressure_feed.key, pressure)
-        self.aio.send(self.iaq_feed.key, iaq)
+        values = [temperature, humidity, pressure, iaq]
+        payload = {
+            "feeds": [
+                {"key": feed_name, "value": value}
+                for (feed_name, value) in zip(FEEDS, values)
+            ]
+        }
+        # Adafruit_IO.Client has no wrapper for the group data endpoint
+        self.aio._post("groups/%s/data" % self.group.key, payload)
@@ -16,10 +16,14 @@ async def sound_the_alarm():
     """
     Coroutine to play a pulsing alarm sound on the piezo buzzer.
     """
+    # The PWM output only exists while the alarm sounds: on a Pi it is
+    # software PWM, which runs a thread for as long as it is open.
     buzzer = pwmio.PWMOut(BUZZER_GPIO, duty_cycle=CYCLE, frequency=FREQ_HI)
-    for i in range(COUNT):
-        await asyncio.sleep(PULSE)
-        buzzer.frequency = FREQ_LO
-        await asyncio.sleep(PULSE)
-        buzzer.frequency = FREQ_HI
-    buzzer.deinit()
+    try:
+        for i in range(COUNT):
+            await asyncio.sleep(PULSE)
+            buzzer.frequency = FREQ_LO
+            await asyncio.sleep(PULSE)
+            buzzer.frequency = FREQ_HI
+    finally:
+        buzzer.deinit()
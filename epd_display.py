@@ -0,0 +1,116 @@
+from PIL import Image
+from adafruit_epd.ssd1680 import Adafruit_SSD1680
+
+# SSD1680 commands, as defined in adafruit_epd.ssd1680
+_SSD1680_MASTER_ACTIVATE = 0x20
+_SSD1680_DISP_CTRL2 = 0x22
+
+# Display update sequence: enable clock and analog, load temperature
+# and LUT, then display using "mode 2" (the partial update waveform)
+_PARTIAL_UPDATE_SEQUENCE = 0xFC
+
+# Transpose which maps an image drawn at each display rotation onto the
+# panel's native orientation
+_ROTATION_TRANSPOSE = {
+    0: None,
+    1: Image.ROTATE_270,
+    2: Image.ROTATE_180,
+    3: Image.ROTATE_90,
+}
+
+def to_monochrome(image: Image.Image) -> Image.Image:
+    """
+    Convert a grayscale image to the 1-bit image the panel displays.
+
+    Pixels darker than 0x80 are black, as in Adafruit_EPD.image().
+
+    Parameters
+    ----------
+    image: the Image to convert, in mode "L".
+    """
+    return image.point(lambda pixel: 255 if pixel >= 0x80 else 0, "1")
+
+class EPD_Display(Adafruit_SSD1680):
+    """
+    SSD1680 e-ink driver with support for partial refreshes.
+
+    A partial refresh only drives the pixels which differ from the
+    previously displayed image, so it is quicker than a full refresh and
+    doesn't flash the whole panel. It leaves some ghosting behind, so a
+    full refresh should still be done every so often.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # width of each framebuffer row, padded to a whole byte
+        self._stride = (self._width + 7) // 8 * 8
+        # 1-bit image with the framebuffer's layout, reused for each frame
+        self._frame = Image.new("1", (self._stride, self._height), 1)
+        self._partial = False
+        self._previous_frame = None
+
+    def display(self, partial: bool = False):
+        """
+        Show the contents of the display buffer.
+
+        Parameters
+        ----------
+        partial: Flag indicating whether to do a partial refresh; ignored
+            if nothing has been displayed yet.
+        """
+        if partial and self._previous_frame is not None:
+            # The controller compares the new image (black RAM) against
+            # the previous one (red RAM) to find the pixels to change.
+            # image() clears the red buffer again before the next frame.
+            self._buffer2[:] = self._previous_frame
+            self._partial = True
+        try:
+            super().display()
+        finally:
+            self._partial = False
+        self._previous_frame = bytes(self._buffer1)
+
+    def image(self, image: Image.Image):
+        """
+        Set the display buffer to the contents of a PIL image.
+
+        Unlike Adafruit_EPD.image(), which sets the buffer one pixel at a
+        time, this rotates and packs the whole image with PIL. The image
+        must be the same size as the display, in mode "1" or "L"; "L" is
+        converted with to_monochrome().
+
+        Parameters
+        ----------
+        image: the Image to display.
+        """
+        if image.size != (self.width, self.height):
+            raise ValueError(
+                "Image must be same dimensions as display ({0}x{1}).".format(
+                    self.width, self.height
+                )
+            )
+        if image.mode == "L":
+            image = to_monochrome(image)
+        elif image.mode != "1":
+            raise ValueError("Image must be in mode 1 or mode L.")
+        transpose = _ROTATION_TRANSPOSE[self.rotation]
+        if transpose is not None:
+            image = image.transpose(transpose)
+        # Packed 1-bit rows, most significant bit first, match the MHMSB
+        # framebuffer layout. The black buffer is inverted, so white pixels
+        # (1) are already the right value; the padding at the end of each
+        # row is set to white too, as Adafruit_EPD.image() leaves it.
+        self._frame.paste(1, (0, 0) + self._frame.size)
+        self._frame.paste(image)
+        self._buffer1[:] = self._frame.tobytes()
+        self._buffer2[:] = bytes(self._buffer2_size)
+
+    def update(self):
+        """
+        Update the display from internal memory.
+        """
+        if not self._partial:
+            super().update()
+            return
+        self.command(_SSD1680_DISP_CTRL2, bytearray([_PARTIAL_UPDATE_SEQUENCE]))
+        self.command(_SSD1680_MASTER_ACTIVATE)
+        self.busy_wait()
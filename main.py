@@ -1,13 +1,16 @@
 import sys
 import os.path
-import json
 import asyncio
-import urllib.request
-import urllib.parse
 from datetime import datetime
 
-import board
-import digitalio
+import aiohttp
+import gpiozero
+from yarl import URL
+try:
+    # orjson is much faster than json and parses bytes directly
+    import orjson as json
+except ImportError:
+    import json
 
 from weather_graphics import Weather_Graphics
 from settings import Settings
@@ -18,30 +21,96 @@ GEOCODING_URL = "http://api.positionstack.com/v1/forward"
 DEBOUNCE_DELAY = 0.3
 WEATHER_REFRESH = 1800 # 30 minutes
 SCREEN_REFRESH = WEATHER_REFRESH / 2 # 15 minutes
+LOG_TIME_FORMAT = "%I:%M %p" # time format used in log messages
+FETCH_RETRIES = 3 # number of retries for a failed API request
+FETCH_BACKOFF = 1 # seconds; doubled after each failed attempt
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30) # per attempt
 
 # C application to read IAQ from BME680 sensor
 BME680_READER_PATH = './bsec/reader'
+# Buffer limit for the sensor reader's output. asyncio keeps draining the
+# pipe until this much is buffered, so the reader does not block on write
+# while the display is being refreshed.
+SENSOR_READ_LIMIT = 1 << 20
 
 DISPLAY_WEATHER = "weather"
 DISPLAY_IAQ = "iaq"
 DISPLAY_FORECAST = "forecast"
 DISPLAY_ALERT = "alert"
 
-settings = Settings('config.ini')
+settings = Settings.from_ini('config.ini')
 settings.dump()
 gfx = Weather_Graphics(am_pm=settings.am_pm, celsius=settings.celsius)
 gfx.initialize_aio(settings.adafruit_username, settings.adafruit_key)
 current_screen = settings.starting_screen
 has_sensor_reader = os.path.isfile(BME680_READER_PATH)
 
+# Map each screen to the coroutine that displays it
+SCREEN_HANDLERS = {
+    DISPLAY_WEATHER: gfx.update_weather_display,
+    DISPLAY_FORECAST: gfx.update_forecast_display,
+    DISPLAY_ALERT: gfx.update_alert_display,
+}
+if has_sensor_reader:
+    SCREEN_HANDLERS[DISPLAY_IAQ] = gfx.update_iaq_display
+
+async def fetch(session: aiohttp.ClientSession, url: URL):
+    """
+    Coroutine to GET a url, retrying with exponential backoff on failure.
+
+    Client errors (4xx, e.g. a bad API key) are not retried, since trying
+    again won't help; the exception is 429 (Too Many Requests).
+
+    Parameters
+    ----------
+    session: The aiohttp session used to make the request.
+    url: The url to retrieve, including its encoded query string.
+
+    Returns
+    -------
+    The response body as bytes, or None if every attempt failed.
+    """
+    delay = FETCH_BACKOFF
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            async with session.get(url, timeout=FETCH_TIMEOUT) as response:
+                if response.status == 200:
+                    return await response.read()
+                eprint("Request to", url, "failed with status", response.status)
+                if 400 <= response.status < 500 and response.status != 429:
+                    return None
+        except aiohttp.ClientError as err:
+            eprint("Request to", url, "failed:", err)
+        except asyncio.TimeoutError:
+            eprint("Request to", url, "timed out")
+        if attempt < FETCH_RETRIES:
+            await asyncio.sleep(delay)
+            delay *= 2
+    return None
+
+async def parse_json(data: bytes):
+    """
+    Coroutine to deserialize a JSON document in a worker thread, so the
+    event loop keeps running while it is parsed.
+
+    Parameters
+    ----------
+    data: The UTF-8 encoded JSON document.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, json.loads, data)
+
 # Make the geocoding api call
-def geocode(query: str, country: str, token: str):
+async def geocode(
+    session: aiohttp.ClientSession, query: str, country: str, token: str
+):
     """
-    Call the geocoding API endpoint from postitionstack.com and
-    return the location of the sent query.
+    Coroutine to call the geocoding API endpoint from postitionstack.com
+    and return the location of the sent query.
 
     Parameters
     ----------
+    session: The aiohttp session used to make the request.
     query: Free-form location query (e.g. address, zip/postal code,
         city name, region name).
     country: Country code used to filter geocoding results;
@@ -53,12 +122,11 @@ def geocode(query: str, country: str, token: str):
     A tuple containing latitude, longitude, and locality name.
     """
     params = {"access_key": token, "query": query, "country": country}
-    geocoding_source = GEOCODING_URL + "?" + urllib.parse.urlencode(params)
+    geocoding_source = URL(GEOCODING_URL).with_query(params)
     locality = None
-    response = urllib.request.urlopen(geocoding_source)
-    if response.getcode() == 200:
-        value = response.read()
-        data = json.loads(value.decode("utf-8"))["data"][0]
+    value = await fetch(session, geocoding_source)
+    if value is not None:
+        data = (await parse_json(value))["data"][0]
         latitude = data["latitude"]
         longitude = data["longitude"]
         locality = data["locality"]
@@ -70,7 +138,11 @@ def geocode(query: str, country: str, token: str):
         )
     return (latitude, longitude, locality)
 
-async def download_weather(latitude, longitude, token, lock: asyncio.Lock):
+async def download_weather(
+    session: aiohttp.ClientSession,
+    location: asyncio.Task, token, lock: asyncio.Lock,
+    weather_ready: asyncio.Event
+):
     """
     Coroutine to download weather data every WEATHER_REFRESH seconds.
 
@@ -78,13 +150,21 @@ async def download_weather(latitude, longitude, token, lock: asyncio.Lock):
 
     Parameters
     ----------
-    latitude: The latitude of the location.
-    longitude: The longitude of the location.
-    locality: The name of the location (used for display).
+    session: The aiohttp session used to make the requests.
+    location: The geocoding task, which resolves to a tuple containing
+        latitude, longitude, and locality name (used for display).
     token: Your OpenWeather API key.
     lock: An asyncio lock, used to synchronize screen updates and
         weather downloads.
+    weather_ready: An asyncio event, set once the first forecast has
+        been downloaded, so that nothing is displayed before then.
     """
+    # Wait for the geocoding lookup, which runs alongside the other
+    # coroutines; nothing is displayed until weather_ready is set, so the
+    # lock is only needed to set the locality.
+    (latitude, longitude, locality) = await location
+    async with lock:
+        gfx.locality = locality
     params = {
         "lat": latitude,
         "lon": longitude,
@@ -92,17 +172,22 @@ async def download_weather(latitude, longitude, token, lock: asyncio.Lock):
         "units": "metric",
         "appid": token
     }
-    forecast_source = FORECAST_URL + "?" + urllib.parse.urlencode(params)
+    # the query never changes, so it is only encoded once
+    forecast_source = URL(FORECAST_URL).with_query(params)
     while True:
-        async with lock:
-            eprint("Updating weather at", datetime.now().strftime("%I:%M %p"))
-            response = urllib.request.urlopen(forecast_source)
-            if response.getcode() == 200:
-                forecast_data = response.read()
-                eprint("Weather data retrieved")
-                await gfx.update_weather(forecast_data)
-            else:
-                eprint("Unable to retrieve data at %s" % forecast_source)
+        if __debug__:
+            eprint("Updating weather at", datetime.now().strftime(LOG_TIME_FORMAT))
+        # The download can take minutes when retrying, so it is done
+        # without the lock; the lock is only held to update the weather.
+        forecast_data = await fetch(session, forecast_source)
+        if forecast_data is not None:
+            eprint("Weather data retrieved")
+            weather = await parse_json(forecast_data)
+            async with lock:
+                await gfx.update_weather(weather)
+            weather_ready.set()
+        else:
+            eprint("Unable to retrieve data at %s" % forecast_source)
         await asyncio.sleep(WEATHER_REFRESH)
 
 async def handle_sensor():
@@ -123,77 +208,75 @@ async def handle_sensor():
         eprint("Initializing BME680 sensor")
         process = await asyncio.create_subprocess_exec(
             BME680_READER_PATH,
-            stdout=asyncio.subprocess.PIPE
+            stdout=asyncio.subprocess.PIPE,
+            limit=SENSOR_READ_LIMIT
         )
         # read and ignore the header line
         _bme680_header = await process.stdout.readline()
-        while process.returncode is None:
-            line = await process.stdout.readline()
-            bme680_data = line.decode().strip()
-            if '|' in bme680_data:
-                gfx.update_iaq(bme680_data)
-        # read data left after process was terminated
-        (stdout_data, _) = await process.communicate()
-        for line in stdout_data.decode().split("\n"):
-            bme680_data = line.strip()
-            if '|' in bme680_data:
-                gfx.update_iaq(bme680_data)
+        # read lines until the process closes its output (EOF)
+        async for line in process.stdout:
+            if b"|" in line:
+                gfx.update_iaq(line.strip())
+        await process.wait()
 
-async def handle_button(lock: asyncio.Lock):
+async def handle_button(lock: asyncio.Lock, weather_ready: asyncio.Event):
     """
     Coroutine to process button presses.
 
+    Presses are detected and debounced by gpiozero on the button's edge,
+    so this coroutine sleeps until a button is actually pressed rather
+    than polling the pins.
+
     Parameters
     ----------
     lock: An asyncio lock, used to synchronize screen updates and
         weather downloads.
+    weather_ready: An asyncio event, set once the first forecast has
+        been downloaded.
     """
     global current_screen
+    loop = asyncio.get_running_loop()
+    presses = asyncio.Queue()
     # screenprinting on Adafruit 2.13" e-Ink board is incorrect.
     # The labels for GPIO 5 and 6 are swapped.
-    up_button = digitalio.DigitalInOut(board.D6)
-    up_button.switch_to_input()
-    down_button = digitalio.DigitalInOut(board.D5)
-    down_button.switch_to_input()
+    up_button = gpiozero.Button(6, pull_up=True, bounce_time=DEBOUNCE_DELAY)
+    down_button = gpiozero.Button(5, pull_up=True, bounce_time=DEBOUNCE_DELAY)
+    # gpiozero calls these from its own thread when an edge is detected
+    up_button.when_pressed = lambda: loop.call_soon_threadsafe(
+        presses.put_nowait, up_button
+    )
+    down_button.when_pressed = lambda: loop.call_soon_threadsafe(
+        presses.put_nowait, down_button
+    )
     await asyncio.sleep(1)
+    # presses are queued until there is weather data to show
+    await weather_ready.wait()
     eprint("Handling buttons")
     while True:
-        up_pressed = not up_button.value
-        down_pressed = not down_button.value
-        if up_pressed or down_pressed:
-            eprint("Detected button press")
-            await asyncio.sleep(DEBOUNCE_DELAY)
+        button = await presses.get()
+        eprint("Detected button press")
+        up_pressed = button is up_button
+        down_pressed = button is down_button
         if up_pressed and has_sensor_reader:
-            # display IAQ
-            async with lock:
-                current_screen = DISPLAY_IAQ
-                eprint("Updating display to show IAQ")
-                await gfx.update_iaq_display()
+            next_screen = DISPLAY_IAQ
         elif down_pressed and (
             current_screen == DISPLAY_WEATHER and gfx.has_alert()
         ):
-            # display the alert
-            async with lock:
-                current_screen = DISPLAY_ALERT
-                eprint("Updating display to show alert")
-                await gfx.update_alert_display()
+            next_screen = DISPLAY_ALERT
         elif down_pressed and (
             current_screen == DISPLAY_WEATHER or current_screen == DISPLAY_ALERT
         ):
-            # display the forecast
-            async with lock:
-                current_screen = DISPLAY_FORECAST
-                eprint("Updating display to show forecast")
-                await gfx.update_forecast_display()
+            next_screen = DISPLAY_FORECAST
         elif down_pressed:
-            # display the weather
-            async with lock:
-                current_screen = DISPLAY_WEATHER
-                eprint("Updating display to show weather")
-                await gfx.update_weather_display()
-        await asyncio.sleep(0.1)
+            next_screen = DISPLAY_WEATHER
+        else:
+            continue
+        async with lock:
+            current_screen = next_screen
+            eprint("Updating display to show", current_screen)
+            await SCREEN_HANDLERS[current_screen]()
 
-async def update_display(lock: asyncio.Lock):
+async def update_display(lock: asyncio.Lock, weather_ready: asyncio.Event):
     """
     Coroutine to update the display every SCREEN_REFRESH seconds.
 
@@ -204,54 +287,48 @@ async def update_display(lock: asyncio.Lock):
     ----------
     lock: An asyncio lock, used to synchronize screen updates and
         weather downloads.
+    weather_ready: An asyncio event, set once the first forecast has
+        been downloaded.
     """
     global current_screen
-    await asyncio.sleep(0.5)
+    await weather_ready.wait()
     while True:
-        eprint("Updating display time to", datetime.now().strftime("%I:%M %p"))
+        if __debug__:
+            eprint("Updating display time to", datetime.now().strftime(LOG_TIME_FORMAT))
         gfx.update_time()
-        if current_screen == DISPLAY_WEATHER:
-            async with lock:
-                eprint("Displaying weather")
-                await gfx.update_weather_display()
-        elif current_screen == DISPLAY_FORECAST:
-            async with lock:
-                eprint("Displaying forecast")
-                await gfx.update_forecast_display()
-        elif current_screen == DISPLAY_IAQ and has_sensor_reader:
-            async with lock:
-                eprint("Displaying iaq")
-                await gfx.update_iaq_display()
-        elif current_screen == DISPLAY_ALERT:
-            async with lock:
+        async with lock:
+            if current_screen == DISPLAY_ALERT:
                 # switch to the weather display
                 current_screen = DISPLAY_WEATHER
-                eprint("Displaying weather")
-                await gfx.update_weather_display()
-        else:
-            eprint("Unknown screen selected:", current_screen)
-            async with lock:
+            elif current_screen not in SCREEN_HANDLERS:
+                eprint("Unknown screen selected:", current_screen)
                 # switch to the weather display
                 current_screen = DISPLAY_WEATHER
-                eprint("Displaying weather")
-                await gfx.update_weather_display()
+            eprint("Displaying", current_screen)
+            await SCREEN_HANDLERS[current_screen]()
         await asyncio.sleep(SCREEN_REFRESH)
 
 async def main():
     """
     Main loop - set up an asyncio lock and run the coroutines.
     """
-    (latitude, longitude, locality) = geocode(
-        settings.query, settings.country, settings.geocoding_token
-    )
-    gfx.locality = locality
-    lock = asyncio.Lock()
-    await asyncio.gather(
-        download_weather(latitude, longitude, settings.weather_token, lock),
-        update_display(lock),
-        handle_button(lock),
-        handle_sensor()
-    )
+    # One kept-alive connection pool, shared by all API requests.
+    # aiohttp asks for compressed responses and decompresses them itself.
+    connector = aiohttp.TCPConnector(limit=4, limit_per_host=2)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        lock = asyncio.Lock()
+        weather_ready = asyncio.Event()
+        # if any task fails, the others are cancelled as the group exits
+        async with asyncio.TaskGroup() as tasks:
+            location = tasks.create_task(geocode(
+                session, settings.query, settings.country, settings.geocoding_token
+            ))
+            tasks.create_task(download_weather(
+                session, location, settings.weather_token, lock, weather_ready
+            ))
+            tasks.create_task(update_display(lock, weather_ready))
+            tasks.create_task(handle_button(lock, weather_ready))
+            tasks.create_task(handle_sensor())
 
 try:
     asyncio.run(main())
@@ -1,10 +1,28 @@
 import configparser
+from dataclasses import dataclass
 
 from eprint import eprint
 
+_AIO_MESSAGE = "You need to set your Adafruit IO key and username first. If you don't already have one, you can register for a free account at https://io.adafruit.com/"
+
+# Settings which must not be empty, with the error to raise if they are
+_REQUIRED_SETTINGS = [
+    (
+        'weather_token',
+        "You need to set your OpenWeather token first. If you don't already have one, you can register for a free account at https://home.openweathermap.org/users/sign_up"
+    ),
+    (
+        'geocoding_token',
+        "You need to set your PositionStack token first. If you don't already have one, you can register for a free account at https://positionstack.com/signup/free"
+    ),
+    ('adafruit_key', _AIO_MESSAGE),
+    ('adafruit_username', _AIO_MESSAGE),
+]
+
+@dataclass(slots=True, frozen=True)
 class Settings:
     """
-    A class to read a settings/ini file and parse the required values.
+    The required values parsed from a settings/ini file.
 
     Properties
     ----------
@@ -33,93 +51,62 @@ class Settings:
 
     Methods
     -------
+    from_ini: Read a settings file and parse the required values.
     dump: Dump the parsed settings file to stderr for debugging.
     """
-    def __init__(self, inifilepath: str):
+    weather_token: str
+    geocoding_token: str
+    query: str
+    country: str
+    adafruit_username: str
+    adafruit_key: str
+    celsius: bool
+    am_pm: bool
+    starting_screen: str
+
+    @classmethod
+    def from_ini(cls, inifilepath: str) -> "Settings":
         """
+        Read a settings/ini file and parse the required values.
+
         Parameters
         ----------
         inifilepath: A string containing a path to the settings file.
         """
         config = configparser.ConfigParser()
-        config.read_file(open(inifilepath))
+        with open(inifilepath) as inifile:
+            config.read_file(inifile)
         try:
             openweather = config['openweatherapi']
-            self._weather_token = openweather.get('token')
-
             positionstack = config['positionstack']
-            self._geocoding_token = positionstack.get('token')
-            self._query = positionstack.get('query')
-            self._country = positionstack.get('country')
-
             adafruit = config['adafruit']
-            self._adafruit_key = adafruit.get('key')
-            self._adafruit_username = adafruit.get('username')
-
             display = config['display']
-            self._celsius = display.getboolean('celsius', fallback = False)
-            self._am_pm = display.getboolean('am_pm', fallback = True)
-            self._starting_screen = display.get('starting_screen')
-
-        except configparser.Error:
-            raise RuntimeError(
-                "Invalid settings file. Please use config.ini.sample to create a properly formatted file."
-            )
-        if len(self._weather_token) == 0:
-            raise RuntimeError(
-                "You need to set your OpenWeather token first. If you don't already have one, you can register for a free account at https://home.openweathermap.org/users/sign_up"
-            )
-        if len(self._geocoding_token) == 0:
-            raise RuntimeError(
-                "You need to set your PositionStack token first. If you don't already have one, you can register for a free account at https://positionstack.com/signup/free"
+            settings = cls(
+                weather_token = openweather.get('token'),
+                geocoding_token = positionstack.get('token'),
+                query = positionstack.get('query'),
+                country = positionstack.get('country'),
+                adafruit_username = adafruit.get('username'),
+                adafruit_key = adafruit.get('key'),
+                celsius = display.getboolean('celsius', fallback = False),
+                am_pm = display.getboolean('am_pm', fallback = True),
+                starting_screen = display.get('starting_screen'),
             )
-        if len(self._adafruit_key) == 0 or len(self._adafruit_username) == 0:
+        except (configparser.Error, KeyError):
             raise RuntimeError(
-                "You need to set your Adafruit IO key and username first. If you don't already have one, you can register for a free account at https://io.adafruit.com/"
+                "Invalid settings file. Please use config.ini.sample to create a properly formatted file."
             )
+        for (attribute, message) in _REQUIRED_SETTINGS:
+            if not getattr(settings, attribute):
+                raise RuntimeError(message)
+        return settings
 
     def dump(self):
         """
         Dump the parsed settings file to stderr for debugging.
         """
         eprint("Parsed settings file")
-        eprint("Location to look up:", self._query, self._country)
-        eprint("Celsius:", self._celsius)
-        eprint("AM/PM indicator:", self._am_pm)
-        eprint("Starting Screen:", self._starting_screen)
-
-    @property
-    def weather_token(self):
-        return self._weather_token
-
-    @property
-    def geocoding_token(self):
-        return self._geocoding_token
-
-    @property
-    def query(self):
-        return self._query
-
-    @property
-    def country(self):
-        return self._country
-
-    @property
-    def adafruit_key(self):
-        return self._adafruit_key
-
-    @property
-    def adafruit_username(self):
-        return self._adafruit_username
-
-    @property
-    def celsius(self):
-        return self._celsius
-
-    @property
-    def am_pm(self):
-        return self._am_pm
-
-    @property
-    def starting_screen(self):
-        return self._starting_screen
+        eprint("Location to look up:", self.query, self.country)
+        eprint("Celsius:", self.celsius)
+        eprint("AM/PM indicator:", self.am_pm)
+        eprint("Starting Screen:", self.starting_screen)
@@ -0,0 +1,35 @@
+import sys
+import unittest
+from unittest import mock
+
+# Stub out the Raspberry Pi hardware modules, so weather_graphics can be
+# imported (and Weather_Graphics created) without a display attached
+for module in ("board", "busio", "digitalio", "pwmio"):
+    sys.modules.setdefault(module, mock.MagicMock())
+
+import weather_graphics
+from weather_graphics import Weather_Graphics
+
+
+class TemperatureTest(unittest.TestCase):
+    def make_graphics(self, celsius: bool) -> Weather_Graphics:
+        with mock.patch.object(weather_graphics, "EPD_Display") as display:
+            display.return_value.width = 250
+            display.return_value.height = 122
+            return Weather_Graphics(celsius=celsius)
+
+    def test_c_to_f(self):
+        self.assertEqual(Weather_Graphics.c_to_f(0), 32)
+        self.assertEqual(Weather_Graphics.c_to_f(100), 212)
+
+    def test_format_temp_range_fahrenheit(self):
+        gfx = self.make_graphics(celsius=False)
+        self.assertEqual(gfx.format_temp_range(10, 20), "50\N{EN DASH}68°F")
+
+    def test_format_temp_range_celsius(self):
+        gfx = self.make_graphics(celsius=True)
+        self.assertEqual(gfx.format_temp_range(10, 20), "10\N{EN DASH}20°C")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,15 @@
-import json
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Callable, Any
 
 import board
 import busio
 import digitalio
-from PIL import Image, ImageDraw, ImageFont
-from adafruit_epd.epd import Adafruit_EPD
-from adafruit_epd.ssd1680 import Adafruit_SSD1680
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 from aio_logger import AIO_Logger
+from epd_display import EPD_Display, to_monochrome
 from eprint import eprint
 from buzzer_alarm import sound_the_alarm
 
@@ -18,16 +18,32 @@ _BOLD_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 _WEATHER_FONT = "/usr/share/fonts/truetype/meteocons/meteocons.ttf"
 
 IAQ_SAMPLES = 15  # number of samples between Adafruit.IO writes
+FORECAST_DAYS = 3  # number of days shown on the forecast display
+PARTIAL_REFRESHES = 10  # max partial refreshes between full refreshes
+PARTIAL_AREA = 0.5  # max fraction of the screen changed for a partial refresh
+
+# Font file and size for each font used on the display
+_FONT_SPECS = {
+    "alert": (_BOLD_FONT, 10),
+    "tiny": (_BOLD_FONT, 12),
+    "small": (_BOLD_FONT, 16),
+    "small_label": (_BOLD_FONT, 14),
+    "medium": (_NORMAL_FONT, 20),
+    "medium_b": (_BOLD_FONT, 20),
+    "large": (_BOLD_FONT, 24),
+    "label": (_NORMAL_FONT, 24),
+    "icon": (_WEATHER_FONT, 48),
+}
+_fonts: dict[str, ImageFont.FreeTypeFont] = {}
 
-alert_font = ImageFont.truetype(_BOLD_FONT, 10)
-tiny_font = ImageFont.truetype(_BOLD_FONT, 12)
-small_font = ImageFont.truetype(_BOLD_FONT, 16)
-small_label_font = ImageFont.truetype(_BOLD_FONT, 14)
-medium_font = ImageFont.truetype(_NORMAL_FONT, 20)
-medium_b_font = ImageFont.truetype(_BOLD_FONT, 20)
-large_font = ImageFont.truetype(_BOLD_FONT, 24)
-label_font = ImageFont.truetype(_NORMAL_FONT, 24)
-icon_font = ImageFont.truetype(_WEATHER_FONT, 48)
+def _font(name: str) -> ImageFont.FreeTypeFont:
+    """
+    Return the named font, loading it on first use.
+    """
+    font = _fonts.get(name)
+    if font is None:
+        font = _fonts[name] = ImageFont.truetype(*_FONT_SPECS[name])
+    return font
 
 # Map the OpenWeatherMap icon code to the appropriate Meteocons font
 # character. See http://www.alessioatzeni.com/meteocons/ for icons.
@@ -43,12 +59,87 @@ ICON_MAP = {
     "50d": "J", "50n": "K",
 }
 
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
+# Colors for the "L" (grayscale) display image
+WHITE = 255
+BLACK = 0
 ALERT_ICON = "⚠"
+# Meteocons icons which show the probability of precipitation, those
+# where it is drawn higher up, and those where it is drawn in black
+_POP_VISIBLE = frozenset("QRWZ78#&")
+_POP_Y_SHIFT = frozenset("QRW78#")
+_POP_FILL_BLACK = frozenset("QRWZ")
+# Abbreviated day names, indexed by datetime.weekday()
+_DOW_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@lru_cache(maxsize=128)
+def _getsize(
+    font: ImageFont.FreeTypeFont, text: str, multiline: bool = False
+) -> tuple[int, int]:
+    """
+    Return the (width, height) of text drawn in font, caching the result.
+
+    Most of the measured strings (labels, icons, the time) repeat from one
+    refresh to the next, so this avoids laying them out again each time.
+    """
+    if multiline:
+        return font.getsize_multiline(text)
+    return font.getsize(text)
+
+
+class Label:
+    """
+    A constant string, rasterized once so it can be pasted onto the
+    display image instead of being drawn with draw.text() every refresh.
+    """
+    def __init__(self, text: str, font: ImageFont.FreeTypeFont, anchor: str):
+        """
+        Parameters
+        ----------
+        text: The text of the label.
+        font: The font to draw the label in.
+        anchor: The PIL text anchor used to position the label.
+        """
+        (left, top, right, bottom) = font.getbbox(text, anchor=anchor)
+        self.offset = (left, top)
+        self.mask = Image.new("L", (right - left, bottom - top), 0)
+        ImageDraw.Draw(self.mask).text(
+            (-left, -top), text, font=font, fill=255, anchor=anchor
+        )
+
+    def paste(self, image: Image.Image, xy: tuple[int, int]):
+        """
+        Paste the label onto image, anchored at xy.
+        """
+        (x, y) = xy
+        image.paste(BLACK, (x + self.offset[0], y + self.offset[1]), self.mask)
+
+
+# Text, font name and anchor for each label used on the display
+_LABEL_SPECS = {
+    "alert": (ALERT_ICON, "large", "rt"),
+    "iaq_title": ("Internal Air Quality Monitor", "small_label", "lb"),
+    "iaq": ("IAQ", "label", "la"),
+    "humidity": ("RH%", "label", "ma"),
+    "temperature": ("TEMP", "label", "ra"),
+}
+_labels: dict[str, Label] = {}
+
+def _label(name: str) -> Label:
+    """
+    Return the named label, rasterizing it (and loading its font) on
+    first use.
+    """
+    label = _labels.get(name)
+    if label is None:
+        (text, font, anchor) = _LABEL_SPECS[name]
+        label = _labels[name] = Label(text, _font(font), anchor)
+    return label
 
 
 class Forecast:
+    __slots__ = ("temprange", "date", "dow", "text", "icon", "pop", "tile")
+
     def __init__(self):
         self.temprange: str = None
         self.date: float = None
@@ -56,6 +147,7 @@ class Forecast:
         self.text: str = None
         self.icon: str = None
         self.pop: str = None
+        self.tile: Image.Image = None
 
 
 class Weather_Graphics:
@@ -69,7 +161,7 @@ class Weather_Graphics:
             if False, use Fahrenheit.
         """
         # initialize the display
-        self.display = Adafruit_SSD1680(
+        self.display = EPD_Display(
             122, 250, busio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO),
             cs_pin=digitalio.DigitalInOut(board.CE0),
             dc_pin=digitalio.DigitalInOut(board.D22),
@@ -78,10 +170,25 @@ class Weather_Graphics:
             busy_pin=digitalio.DigitalInOut(board.D17)
         )
         self.display.rotation = 1
+        # Persistent image to draw each frame on, rather than allocating a
+        # new image every time. The display is monochrome, so draw in
+        # grayscale rather than RGB, and keep the 1-bit frame last shown
+        # to find what changed.
+        size = (self.display.width, self.display.height)
+        self._fb_image = Image.new("L", size, color=WHITE)
+        self._fb_draw = ImageDraw.Draw(self._fb_image)
+        self._last_frame: Image.Image = None
 
         self.am_pm = am_pm
         self.celsius = celsius
         self.timeformat = "%I:%M %p" if self.am_pm else "%H:%M"
+        # pick the temperature conversion once, rather than on every format
+        if self.celsius:
+            self._to_display_temp = lambda temperature: temperature
+            self._temp_unit = "°C"
+        else:
+            self._to_display_temp = self.c_to_f
+            self._temp_unit = "°F"
 
         self._forecast: list[Forecast] = []
         self._weather_icon = None
@@ -98,6 +205,7 @@ class Weather_Graphics:
         self._iaq_log_time = 0
         self._alert_event = None
         self._alert_description = None
+        self._partial_count = 0
 
     @property
     def locality(self):
@@ -130,6 +238,7 @@ class Weather_Graphics:
         """
         return self._alert_event is not None
 
+    @staticmethod
     def c_to_f(temperature: float) -> float:
         """
         Convert Celsius temperature to Fahrenheit.
@@ -140,34 +249,27 @@ class Weather_Graphics:
         """
         Format a numeric temperature to a string, converting if needed.
         """
-        if self.celsius:
-            return "%d°C" % temperature
-        else:
-            return "%d°F" % self.c_to_f(temperature)
+        return "%d%s" % (self._to_display_temp(temperature), self._temp_unit)
 
     def format_temp_range(self, min: float, max: float) -> str:
         """
         Format a temperature range to a string, converting if needed.
         """
-        if self.celsius:
-            return "%d\N{EN DASH}%d°C" % (min, max)
-        else:
-            return "%d\N{EN DASH}%d°F" % (self.c_to_f(min), self.c_to_f(max))
+        convert = self._to_display_temp
+        return "%d\N{EN DASH}%d%s" % (convert(min), convert(max), self._temp_unit)
 
-    async def update_weather(self, weather_json: str):
+    async def update_weather(self, weather: dict):
         """
         Update weather data used for display.
 
         Parameters
         ----------
-        weather_json: string containing JSON object of weather data.
+        weather: deserialized JSON weather data.
         """
-        weather = json.loads(weather_json.decode("utf-8"))
-        self._weather_icon = self.get_icon(weather["current"]["weather"][0]["icon"])
+        self._weather_icon = ICON_MAP[weather["current"]["weather"][0]["icon"]]
         self._main_text = weather["current"]["weather"][0]["main"]
-        description:str = weather["current"]["weather"][0]["description"]
-        description = description[:1].upper() + description[1:].lower()
-        self._description = description  # example: "light rain"
+        description: str = weather["current"]["weather"][0]["description"]
+        self._description = description.capitalize()  # example: "Light rain"
         self._temperature = self.format_temperature(weather["current"]["temp"])
         previous_alert = self._alert_event
         if "alerts" in weather:
@@ -176,57 +278,71 @@ class Weather_Graphics:
         else:
             self._alert_event = None
             self._alert_description = None
-        self.update_time()
-        self.update_forecast(weather["daily"])
+        now = datetime.now()
+        self.update_time(now)
+        self.update_forecast(weather["daily"], now)
         if previous_alert is None and self._alert_event is not None:
             eprint("NEW WEATHER ALERT RECEIVED")
             await sound_the_alarm()
 
-    def update_time(self):
+    def update_time(self, now: datetime = None):
         """
         Update the time used for the display.
+
+        Parameters
+        ----------
+        now: the current time; looked up if not given.
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         self._time_text = now.strftime(self.timeformat)
 
-    def update_forecast(self, daily):
+    def update_forecast(self, daily, now: datetime = None):
         """
         Update weather forecast data.
 
         Parameters
         ----------
         daily: deserialized JSON daily weather forecast data.
+        now: the current time; looked up if not given.
         """
+        if now is None:
+            now = datetime.now()
         self._forecast = []
         for day in daily:
             forecast = Forecast()
             min = day["temp"]["min"]
             max = day["temp"]["max"]
             forecast.temprange = self.format_temp_range(min, max)
-            forecast.date = float(day["dt"])
-            forecast.dow = datetime.fromtimestamp(float(day["dt"])).strftime("%a")
+            timestamp = day["dt"]
+            forecast.date = float(timestamp)
+            forecast.dow = _DOW_NAMES[datetime.fromtimestamp(timestamp).weekday()]
             if day["weather"][0]["main"].lower() == "thunderstorm":
                 forecast.text = "Storm"
             else:
                 forecast.text = day["weather"][0]["main"]
-            forecast.icon = self.get_icon(day["weather"][0]["icon"])
+            forecast.icon = ICON_MAP[day["weather"][0]["icon"]]
             forecast.pop = "%d%%" % (day["pop"] * 100)
             self._forecast.append(forecast)
-        if datetime.now().hour > 12:  # remove today's forecast if after noon
+        if now.hour > 12:  # remove today's forecast if after noon
             self._forecast.pop(0)
+        for forecast in self._forecast[:FORECAST_DAYS]:
+            self.render_forecast(forecast)
 
-    def update_iaq(self, data):
+    def update_iaq(self, data: bytes):
         """
         Capture the current IAQ data for display and logging.
 
         Parameters
         ----------
-        data: A pipe-delimited string containing the IAQ data.
+        data: A pipe-delimited line of bytes containing the IAQ data,
+            as read from the sensor reader.
         """
-        if not "|" in data:
+        if not b"|" in data:
             eprint("Invalid data format (missing pipe)", data)
             return
-        (timestamp, temperature, pressure, humidity, _gas, iaq) = data.split("|")
+        fields = data.decode().split("|")
+        (timestamp, temperature, pressure, humidity, _gas, iaq) = fields
         timer = float(timestamp)
         self._iaq_temperature = self.format_temperature(float(temperature))
         self._iaq_pressure = pressure
@@ -243,65 +359,106 @@ class Weather_Graphics:
                 iaq
             )
 
-    async def update_display(self, draw_function: Callable[[Any], None]):
+    async def _render_and_flush(self, draw_function: Callable[[Any, Any], None]):
         """
         Coroutine to update the e-ink display based on draw_function.
 
+        All of the update_*_display coroutines go through here. Refreshing
+        the panel takes seconds while drawing takes milliseconds, so the
+        work is in sending and refreshing as little as possible: the frame
+        is reduced to the panel's 1-bit format, compared with the frame
+        last shown, and only sent if it changed, with a partial refresh
+        when the change is small.
+
         Parameters
         ----------
-        draw_function: a function that takes an ImageDraw object and
-            draws the appropriate weather data on it for display.
-        """
-        self.display.fill(Adafruit_EPD.WHITE)
-        image = Image.new(
-            "RGB",
-            (self.display.width, self.display.height),
-            color=WHITE
-        )
-        draw = ImageDraw.Draw(image)
+        draw_function: a function that takes an ImageDraw object and the
+            Image it draws on, and draws the appropriate weather data on
+            them for display.
+        """
+        image = self._fb_image
+        draw = self._fb_draw
+        image.paste(WHITE, (0, 0) + image.size)
+
+        await draw_function(draw, image) # call the function that does the actual drawing
+        frame = to_monochrome(image)
+
+        # Use a partial refresh when only a small part of the image has
+        # changed (e.g. the time), with a full refresh every so often to
+        # clear the ghosting that partial refreshes leave behind.
+        partial = False
+        if self._last_frame is not None:
+            # compare what the panel would show, so that changes to
+            # antialiased edges which don't survive the threshold are ignored
+            dirty = ImageChops.logical_xor(frame, self._last_frame).getbbox()
+            if dirty is None:
+                eprint("Display unchanged, skipping refresh")
+                return
+            (left, top, right, bottom) = dirty
+            partial = (
+                self._partial_count < PARTIAL_REFRESHES and
+                (right - left) * (bottom - top) <=
+                    PARTIAL_AREA * frame.width * frame.height
+            )
 
-        await draw_function(draw) # call the function that does the actual drawing
+        # sending the image and waiting for the panel to refresh takes
+        # seconds, so do it in a worker thread to keep the event loop free
+        await asyncio.to_thread(self._blocking_flush, frame, partial)
+        # only record the frame once it has reached the panel, so a failed
+        # flush isn't mistaken for the frame being shown
+        self._last_frame = frame
+        self._partial_count = self._partial_count + 1 if partial else 0
 
+    def _blocking_flush(self, image: Image.Image, partial: bool):
+        """
+        Send image to the e-ink display and wait for it to refresh.
+
+        Parameters
+        ----------
+        image: the Image to display.
+        partial: Flag indicating whether to do a partial refresh.
+        """
         self.display.image(image)
-        self.display.display()
+        self.display.display(partial=partial)
 
     async def update_weather_display(self):
         """
         Coroutine to display current weather data on the e-ink display.
         """
-        await self.update_display(self.draw_weather)
+        await self._render_and_flush(self.draw_weather)
 
     async def update_forecast_display(self):
         """
         Coroutine to display 3 days of Forecast data on the e-ink display.
         """
-        await self.update_display(self.draw_forecast)
+        await self._render_and_flush(self.draw_forecast)
 
     async def update_alert_display(self):
         """
         Coroutine to display Weather Alert data on the e-ink display.
         """
-        await self.update_display(self.draw_alert)
+        await self._render_and_flush(self.draw_alert)
 
     async def update_iaq_display(self):
         """
         Coroutine to display current IAQ data on the e-ink display.
         """
-        await self.update_display(self.draw_iaq)
+        await self._render_and_flush(self.draw_iaq)
 
-    async def draw_weather(self, draw):
+    async def draw_weather(self, draw, image):
         """
         Coroutine to draw the weather data on the draw buffer.
 
         Parameters
         ----------
         draw: an ImageDraw object set up to draw on the display.
+        image: the Image that draw is drawing on.
         """
         # Draw the icon
         draw.text(
             (self.display.width // 2, self.display.height // 2),
             self._weather_icon,
-            font=icon_font,
+            font=_font("icon"),
             fill=BLACK,
             anchor="mm"
         )
@@ -309,25 +466,25 @@ class Weather_Graphics:
         draw.text(
             (5, 5),
             self.locality,
-            font=medium_font,
+            font=_font("medium"),
             fill=BLACK,
             anchor="la"
         )
         # Draw the time
-        (_, font_height) = medium_font.getsize(self._time_text)
+        (_, font_height) = _getsize(_font("medium"), self._time_text)
         draw.text(
             (5, font_height * 2 - 5),
             self._time_text,
-            font=medium_font,
+            font=_font("medium"),
             fill=BLACK,
             anchor="la"
         )
         # Draw the main text
-        (_, font_height) = large_font.getsize(self._main_text)
+        (_, font_height) = _getsize(_font("large"), self._main_text)
         draw.text(
             (5, self.display.height - font_height * 2),
             self._main_text,
-            font=large_font,
+            font=_font("large"),
             fill=BLACK,
             anchor="la"
         )
@@ -335,7 +492,7 @@ class Weather_Graphics:
         draw.text(
             (5, self.display.height - 5),
             self._description,
-            font=small_font,
+            font=_font("small"),
             fill=BLACK,
             anchor="lb"
         )
@@ -343,187 +500,191 @@ class Weather_Graphics:
         draw.text(
             (self.display.width - 5, self.display.height - 5),
             self._temperature,
-            font=large_font,
+            font=_font("large"),
             fill=BLACK,
             anchor="rb"
         )
         # Draw the alert, if any
         if self._alert_event is not None:
-            (_, icon_font_height) = large_font.getsize(ALERT_ICON)
-            draw.text(
-                (self.display.width - 5, 0),
-                ALERT_ICON,
-                font=large_font,
-                fill=BLACK,
-                anchor="rt"
+            (_, icon_font_height) = _getsize(_font("large"), ALERT_ICON)
+            _label("alert").paste(image, (self.display.width - 5, 0))
+            (font_width, _) = _getsize(
+                _font("small_label"), self._alert_event, multiline=True
             )
-            (font_width, _) = small_label_font.getsize_multiline(self._alert_event)
             draw.multiline_text(
                 (self.display.width - font_width - 5, icon_font_height + 2),
                 self._alert_event,
-                font=small_label_font,
+                font=_font("small_label"),
                 fill=BLACK,
                 align="right"
             )
 
-    async def draw_forecast(self, draw):
+    async def draw_forecast(self, draw, image):
         """
         Coroutine to draw the forecast data on the draw buffer.
 
         Parameters
         ----------
         draw: an ImageDraw object set up to draw on the display.
+        image: the Image that draw is drawing on.
         """
         xpos = [40, self.display.width // 2, self.display.width - 40]
-        for i in range(3):
-            forecast = self._forecast[i]
-            # Draw the day of the week
-            draw.text(
-                (xpos[i], 5),
-                forecast.dow,
-                font=medium_font,
-                fill=BLACK,
-                anchor="ma"
-            )
-            # Draw the temperature range
-            draw.text(
-                (xpos[i], 30),
-                forecast.temprange,
-                font=small_font,
-                fill=BLACK,
-                anchor="ma"
-            )
-            # Draw the forecast text
-            draw.text(
-                (xpos[i], 45),
-                forecast.text,
-                font=medium_b_font,
-                fill=BLACK,
-                anchor="ma"
-            )
-            # Draw the icon
-            draw.text(
-                (xpos[i], 70),
-                forecast.icon,
-                font=icon_font,
-                fill=BLACK,
-                anchor="ma"
-            )
-            # Draw the probability of precipitation
-            if forecast.pop is not None:
-                y = 79 if forecast.icon in ["Q", "R", "W", "7", "8", "#"] else 88
-                fill = BLACK if forecast.icon in ["Q", "R", "W", "Z"] else WHITE
-                if forecast.icon in ["Q", "R", "W", "Z", "7", "8", "#", "&"]:
-                    draw.text(
-                        (xpos[i], y),
-                        forecast.pop,
-                        font=tiny_font,
-                        fill=fill,
-                        anchor="ma"
-                    )
-
-    async def draw_alert(self, draw):
+        for i in range(FORECAST_DAYS):
+            tile = self._forecast[i].tile
+            image.paste(BLACK, (xpos[i] - tile.width // 2, 0), tile)
+
+    def render_forecast(self, forecast: Forecast):
+        """
+        Render one day of forecast data to its own image tile.
+
+        The tiles only change when new forecast data arrives, so they are
+        drawn once here rather than on every display refresh. The tile is
+        a mask, like Label, so it can be pasted without blanking out the
+        neighbouring days where long text overlaps them.
+
+        Parameters
+        ----------
+        forecast: the Forecast to render; its tile attribute is set.
+        """
+        # make the tile wide enough for the widest centred text
+        half_width = self.display.width // FORECAST_DAYS // 2
+        for (text, font) in (
+            (forecast.dow, "medium"),
+            (forecast.temprange, "small"),
+            (forecast.text, "medium_b"),
+            (forecast.icon, "icon"),
+        ):
+            (left, _, right, _) = _font(font).getbbox(text, anchor="ma")
+            half_width = max(half_width, -left, right)
+        tile = Image.new("L", (2 * half_width + 1, self.display.height), color=WHITE)
+        draw = ImageDraw.Draw(tile)
+        x = tile.width // 2
+        # Draw the day of the week
+        draw.text(
+            (x, 5),
+            forecast.dow,
+            font=_font("medium"),
+            fill=BLACK,
+            anchor="ma"
+        )
+        # Draw the temperature range
+        draw.text(
+            (x, 30),
+            forecast.temprange,
+            font=_font("small"),
+            fill=BLACK,
+            anchor="ma"
+        )
+        # Draw the forecast text
+        draw.text(
+            (x, 45),
+            forecast.text,
+            font=_font("medium_b"),
+            fill=BLACK,
+            anchor="ma"
+        )
+        # Draw the icon
+        draw.text(
+            (x, 70),
+            forecast.icon,
+            font=_font("icon"),
+            fill=BLACK,
+            anchor="ma"
+        )
+        # Draw the probability of precipitation
+        if forecast.pop is not None:
+            y = 79 if forecast.icon in _POP_Y_SHIFT else 88
+            fill = BLACK if forecast.icon in _POP_FILL_BLACK else WHITE
+            if forecast.icon in _POP_VISIBLE:
+                draw.text(
+                    (x, y),
+                    forecast.pop,
+                    font=_font("tiny"),
+                    fill=fill,
+                    anchor="ma"
+                )
+        forecast.tile = ImageChops.invert(tile)
+
+    async def draw_alert(self, draw, image):
         """
         Coroutine to draw the alert data on the draw buffer.
 
         Parameters
         ----------
         draw: an ImageDraw object set up to draw on the display.
+        image: the Image that draw is drawing on.
         """
         # Draw the alert text
         event = self._alert_event.replace("\n", " ")
-        (_, font_height) = medium_b_font.getsize(event)
+        (_, font_height) = _getsize(_font("medium_b"), event)
         draw.text(
             (5, 5),
             event,
-            font=medium_b_font,
+            font=_font("medium_b"),
             fill=BLACK,
             anchor="lt"
         )
         # Draw the alert icon
-        draw.text(
-            (self.display.width - 5, 0),
-            ALERT_ICON,
-            font=large_font,
-            fill=BLACK,
-            anchor="rt"
-        )
+        _label("alert").paste(image, (self.display.width - 5, 0))
         # Draw the alert description
         draw.multiline_text(
             (5, font_height + 5),
             self._alert_description,
-            font=alert_font,
+            font=_font("alert"),
             fill=BLACK,
             spacing=3
         )
 
-    async def draw_iaq(self, draw):
+    async def draw_iaq(self, draw, image):
         """
         Coroutine to draw the IAQ data on the draw buffer.
 
         Parameters
         ----------
         draw: an ImageDraw object set up to draw on the display.
+        image: the Image that draw is drawing on.
         """
         # Draw the label
-        draw.text(
-            (5, self.display.height - 3),
-            "Internal Air Quality Monitor",
-            font=small_label_font,
-            fill=BLACK,
-            anchor="lb"
-        )
+        _label("iaq_title").paste(image, (5, self.display.height - 3))
         # Draw the time
-        (_, time_font_height) = small_font.getsize(self._iaq_time)
+        (_, time_font_height) = _getsize(_font("small"), self._iaq_time)
         draw.text(
             (self.display.width - 3, 5),
             self._iaq_time,
-            font=small_font,
+            font=_font("small"),
             fill=BLACK,
             anchor="ra"
         )
         # Draw the IAQ - left justified
-        (_, font_height) = large_font.getsize(self._iaq_quality)
+        (_, font_height) = _getsize(_font("large"), self._iaq_quality)
         label_y = time_font_height * 2 + 5
         data_y = label_y + font_height + 2
         draw.text(
             (3, data_y),
             self._iaq_quality,
-            font=large_font,
+            font=_font("large"),
             fill=BLACK,
             anchor="la"
         )
         # Draw the IAQ label - left justified
-        draw.text((3, label_y), "IAQ", font=label_font, fill=BLACK, anchor="la")
+        _label("iaq").paste(image, (3, label_y))
         # Draw the relative humidity - centered
         draw.text(
             (self.display.width // 2, data_y),
             self._iaq_humidity,
-            font=large_font,
+            font=_font("large"),
             fill=BLACK,
             anchor="ma"
         )
         # Draw the relative humidity label - centered
-        draw.text(
-            (self.display.width // 2, label_y),
-            "RH%",
-            font=label_font,
-            fill=BLACK,
-            anchor="ma"
-        )
+        _label("humidity").paste(image, (self.display.width // 2, label_y))
         # Draw the temperature - right justified
         draw.text(
             (self.display.width - 3, data_y),
             self._iaq_temperature,
-            font=large_font,
+            font=_font("large"),
             fill=BLACK,
             anchor="ra"
         )
         # Draw the temperature label - right justified
-        draw.text(
-            (self.display.width - 3, label_y),
-            "TEMP",
-            font=label_font,
-            fill=BLACK,
-            anchor="ra"
-        )
+        _label("temperature").paste(image, (self.display.width - 3, label_y))